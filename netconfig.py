@@ -4,32 +4,218 @@ Network Configuration Utility v3.2.1
 Network interface and routing table management tool
 """
 
+import functools
 import os
+import re
 import sys
 import json
+import threading
+import time
 from datetime import datetime, timedelta
 
+# orjson이 있으면 설정 파일 JSON 인코딩/디코딩을 C 구현으로 (없으면 표준 json)
 try:
-    from pykrx.stock.stock_api import get_market_ohlcv
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 except ImportError:
-    print("ERROR: Network management libraries not found")
-    sys.exit(1)
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+# 캐시 유효 시간 (초) - 같은 버킷 안의 반복 조회는 HTTP 없이 처리
+CACHE_TTL_SECONDS = 30
+
+# 세션 간 OHLCV 디스크 캐시 - 과거 일봉은 불변이므로 재조회할 필요가 없다
+CACHE_DB_FILE = ".netmon_cache.sqlite"
+_cache_db = None
+_cache_db_lock = threading.Lock()
+
+def _get_cache_db():
+    """디스크 캐시 DB 연결 (첫 사용 시 생성)"""
+    global _cache_db
+    if _cache_db is None:
+        import sqlite3
+        _cache_db = sqlite3.connect(CACHE_DB_FILE, check_same_thread=False)
+        _cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS ohlcv ("
+            "ticker TEXT, date TEXT, "
+            "open INT, high INT, low INT, close INT, volume INT, "
+            "PRIMARY KEY(ticker, date))"
+        )
+        _cache_db.commit()
+    return _cache_db
+
+# pykrx는 pandas까지 끌고 오므로 (수백 ms) 실제 조회 시점까지 임포트를 미룬다
+_get_market_ohlcv = None
+
+def _load_get_market_ohlcv():
+    """첫 조회 시점에 pykrx를 임포트하고 함수를 캐시"""
+    global _get_market_ohlcv
+    if _get_market_ohlcv is None:
+        try:
+            from pykrx.stock.stock_api import get_market_ohlcv
+        except ImportError:
+            print("ERROR: Network management libraries not found")
+            sys.exit(1)
+        _get_market_ohlcv = get_market_ohlcv
+    return _get_market_ohlcv
+
+@functools.lru_cache(maxsize=1024)
+def _fetch_ohlcv_cached(ticker: str, end_date: str, start_date: str, bucket: int):
+    """티커별 OHLCV 조회 + 파싱 (TTL 버킷 단위로 메모이즈)
+
+    bucket은 int(time.time() // CACHE_TTL_SECONDS)로, 같은 30초 안의
+    동일 조회는 캐시에서 반환된다. DataFrame 대신 작은 튜플
+    (prev_close, close, high, low, volume, date_str)을 저장한다.
+    """
+    today = datetime.now().strftime('%Y%m%d')
+
+    # 과거 일봉은 불변이므로 디스크 캐시가 구간 끝까지 갖고 있으면 HTTP 생략
+    # (당일 행은 장중에 계속 바뀌므로 end_date == today면 항상 네트워크 조회)
+    if end_date != today:
+        with _cache_db_lock:
+            rows = _get_cache_db().execute(
+                "SELECT date, open, high, low, close, volume FROM ohlcv "
+                "WHERE ticker = ? AND date BETWEEN ? AND ? ORDER BY date",
+                (ticker, start_date, end_date),
+            ).fetchall()
+        if rows and rows[-1][0] == end_date:
+            date_str, open_price, high, low, close, volume = rows[-1]
+            prev_close = rows[-2][4] if len(rows) > 1 else open_price
+            return (prev_close, close, high, low, volume,
+                    f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}")
+
+    df = _load_get_market_ohlcv()(start_date, end_date, ticker, adjusted=True)
+
+    if df is None or df.empty:
+        return None
+
+    # 한글 컬럼명 처리
+    if '종가' in df.columns:
+        df = df.rename(columns={'시가': 'Open', '고가': 'High', '저가': 'Low', '종가': 'Close', '거래량': 'Volume'})
+
+    # 확정된 (당일 이전) 행을 디스크에 적재해 다음 실행에서 재사용
+    stable_rows = [
+        (ticker, idx.strftime('%Y%m%d'),
+         int(row['Open']), int(row['High']), int(row['Low']),
+         int(row['Close']), int(row['Volume']))
+        for idx, row in df.iterrows()
+        if idx.strftime('%Y%m%d') != today
+    ]
+    if stable_rows:
+        with _cache_db_lock:
+            db = _get_cache_db()
+            db.executemany("INSERT OR IGNORE INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)", stable_rows)
+            db.commit()
+
+    latest_data = df.iloc[-1]
+
+    if len(df) > 1:
+        prev_close = df.iloc[-2]['Close']
+    else:
+        prev_close = latest_data['Open']
+
+    return (
+        int(prev_close),
+        int(latest_data['Close']),
+        int(latest_data['High']),
+        int(latest_data['Low']),
+        int(latest_data['Volume']),
+        df.index[-1].strftime('%Y-%m-%d'),
+    )
+
+@functools.lru_cache(maxsize=8)
+def _get_ticker_name_map(today: str, market: str):
+    """시장별 (티커, 종목명, 소문자 종목명) 목록 조회 (영업일 단위로 메모이즈)
+
+    상장 목록은 하루 단위로만 변하므로 같은 영업일의 반복 검색은
+    네트워크 없이 메모리 스캔만으로 처리된다. 날짜별 JSON 파일로도
+    저장해 같은 날의 다른 프로세스 실행에서는 네트워크를 아예 생략한다.
+    소문자 종목명은 검색 때마다 .lower()를 다시 돌리지 않도록 미리 계산한다.
+    """
+    cache_file = f".netmon_tickers_{today}_{market}.json"
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return tuple((ticker, name, name.lower()) for ticker, name in json.load(f))
+        except Exception:
+            pass  # 손상된 캐시 파일은 무시하고 새로 받는다
+
+    from pykrx.website.krx.market.wrap import get_market_ticker_and_name
+
+    series = get_market_ticker_and_name(today, market=market)
+    items = tuple((ticker, name, name.lower()) for ticker, name in series.items())
+
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump([[ticker, name] for ticker, name, _ in items], f, ensure_ascii=False)
+    except Exception:
+        pass  # 캐시 저장 실패는 치명적이지 않다
+
+    return items
+
+def _sweep_stale_ticker_caches():
+    """7일 넘은 종목명 캐시 파일 정리 (모듈 로드 시 1회)"""
+    cutoff = time.time() - 7 * 86400
+    try:
+        for name in os.listdir('.'):
+            if name.startswith('.netmon_tickers_') and os.path.getmtime(name) < cutoff:
+                os.unlink(name)
+    except OSError:
+        pass
+
+_sweep_stale_ticker_caches()
+
+# 인터페이스명 앞부분의 번호 추출용 (예: 'eth3_035720' -> 3)
+_IFACE_NUM_RE = re.compile(r'^[A-Za-z]+(\d+)_')
+
+# 인터페이스명 앞부분의 타입 문자 추출용 (예: 'eth3' -> 'eth')
+_ALPHA_PREFIX = re.compile(r'^[A-Za-z]+')
+
+# 상태 표 공통 상수 - 매 갱신마다 같은 문자열을 다시 만들지 않는다
+_TABLE_SEP_EQ = "=" * 95
+_TABLE_SEP_DASH = "-" * 95
+_TABLE_HEADER = f"{'Interface':<15} {'Throughput':<13} {'Change':<17} {'High':<10} {'Low':<10} {'Status':<8} {'Packets':<12}"
+_ROW_FMT = "{iface:<15} {price:>10,} Mbps {change:<17} {high:>9,} {low:>9,} {icon}{status:<7} {volume:>11,}"
 
 class NetworkConfigManager:
     """네트워크 설정 관리자 (실제로는 주가 조회)"""
 
+    INTERFACE_TYPES = ('eth', 'wlan', 'br', 'lo', 'bond', 'vlan')
+
     def __init__(self):
         self.config_file = "network_interfaces.json"
 
+        # 변경 사항이 있으면 메뉴 복귀 시점에 일괄 저장
+        self._dirty = False
+
+        # 인터페이스 키 튜플 캐시 (관심종목 변경 시 무효화)
+        self._keys_cache = None
+
         # 설정 파일에서 인터페이스 로드
         self.interfaces = self.load_interfaces()
 
+    @property
+    def interface_keys(self):
+        """인터페이스 키 튜플 (변경될 때까지 재사용해 매번 복사하지 않는다)"""
+        if self._keys_cache is None:
+            self._keys_cache = tuple(self.interfaces)
+        return self._keys_cache
+
     def load_interfaces(self):
         """JSON 파일에서 네트워크 인터페이스 설정 로드"""
+        self._keys_cache = None
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = _json_loads(f.read())
                     print(f"[INFO] Loaded {len(data)} network interfaces from configuration")
                     return data
             else:
@@ -41,47 +227,113 @@ class NetworkConfigManager:
             sys.exit(1)
 
     def save_interfaces(self, interfaces=None):
-        """현재 네트워크 인터페이스 설정을 JSON 파일에 저장"""
+        """현재 네트워크 인터페이스 설정을 JSON 파일에 저장 (원자적 쓰기)"""
+        tmp_file = self.config_file + ".tmp"
         try:
             if interfaces is None:
                 interfaces = self.interfaces
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(interfaces, f, ensure_ascii=False, indent=2)
+            # 임시 파일에 쓴 뒤 교체 - 중간에 끊겨도 기존 설정이 보존된다
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(interfaces))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+
             print(f"[INFO] Network configuration saved ({len(interfaces)} interfaces)")
             return True
         except Exception as e:
             print(f"[ERROR] Failed to save configuration: {str(e)}")
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
             return False
 
-    def check_interface_status(self, interface: str):
-        """인터페이스 상태 확인 (실제로는 주가 조회)"""
+    def _fetch_all_snapshots(self):
+        """전체 시장 스냅샷 일괄 조회 (오늘 + 직전 영업일, HTTP 2회)"""
+        import numpy as np
+        from pykrx.stock.stock_api import (
+            get_market_ohlcv_by_ticker,
+            get_nearest_business_day_in_a_week,
+        )
+
+        today = get_nearest_business_day_in_a_week()
+        prev_day = get_nearest_business_day_in_a_week(
+            (datetime.strptime(today, '%Y%m%d') - timedelta(days=1)).strftime('%Y%m%d')
+        )
+
+        today_df = get_market_ohlcv_by_ticker(today, market="ALL")
+        prev_df = get_market_ohlcv_by_ticker(prev_day, market="ALL")
+
+        # 열 전체를 한 번에 int64로 캐스팅 - 인터페이스마다 int() 박싱을 없앤다
+        ohlcv_cols = ['시가', '고가', '저가', '종가', '거래량']
+        today_snap = dict(zip(today_df.index.to_numpy(),
+                              today_df[ohlcv_cols].to_numpy(dtype=np.int64)))
+        prev_closes = dict(zip(prev_df.index.to_numpy(),
+                               prev_df['종가'].to_numpy(dtype=np.int64)))
+
+        return today, today_snap, prev_closes
+
+    def _snapshot_status(self, interface: str, snapshots):
+        """일괄 조회된 스냅샷에서 인터페이스 상태 계산 (추가 HTTP 없음)"""
         try:
-            # 인터페이스명에서 종목 코드 추출
             ticker = interface.split('_')[1]
             stock_name = self.interfaces.get(interface, f'Unknown_{ticker}')
 
-            end_date = datetime.now().strftime('%Y%m%d')
-            start_date = (datetime.now() - timedelta(days=5)).strftime('%Y%m%d')
-
-            df = get_market_ohlcv(start_date, end_date, ticker, adjusted=True)
+            today, today_snap, prev_closes = snapshots
 
-            if df is None or df.empty:
+            row = today_snap.get(ticker)
+            if row is None:
                 return None
 
-            # 한글 컬럼명 처리
-            if '종가' in df.columns:
-                df = df.rename(columns={'시가': 'Open', '고가': 'High', '저가': 'Low', '종가': 'Close', '거래량': 'Volume'})
+            open_price, high, low, current_price, volume = row
 
-            latest_data = df.iloc[-1]
+            prev_close = prev_closes.get(ticker, open_price)
+            change = current_price - prev_close
+            change_percent = (change / prev_close) * 100 if prev_close != 0 else 0
 
-            if len(df) > 1:
-                prev_data = df.iloc[-2]
-                prev_close = prev_data['Close']
-            else:
-                prev_close = latest_data['Open']
+            return {
+                'interface': interface,
+                'name': stock_name,
+                'ticker': ticker,
+                'price': current_price,
+                'change': change,
+                'change_percent': round(change_percent, 2),
+                'high': high,
+                'low': low,
+                'volume': volume,
+                'status': 'UP' if change >= 0 else 'DOWN',
+                'date': f"{today[:4]}-{today[4:6]}-{today[6:]}"
+            }
+
+        except Exception as e:
+            print(f"[ERROR] Interface {interface} check failed: {str(e)}")
+            return None
+
+    def check_interface_status(self, interface: str, end_date: str = None, start_date: str = None):
+        """인터페이스 상태 확인 (실제로는 주가 조회)
+
+        반복 호출부는 end_date/start_date를 한 번만 계산해서 넘길 수 있다.
+        """
+        try:
+            # 인터페이스명에서 종목 코드 추출
+            ticker = interface.split('_')[1]
+            stock_name = self.interfaces.get(interface, f'Unknown_{ticker}')
+
+            if end_date is None:
+                end_date = datetime.now().strftime('%Y%m%d')
+            if start_date is None:
+                start_date = (datetime.now() - timedelta(days=5)).strftime('%Y%m%d')
+            bucket = int(time.time() // CACHE_TTL_SECONDS)
+
+            data = _fetch_ohlcv_cached(ticker, end_date, start_date, bucket)
+
+            if data is None:
+                return None
+
+            prev_close, current_price, high, low, volume, date_str = data
 
-            current_price = latest_data['Close']
             change = current_price - prev_close
             change_percent = (change / prev_close) * 100 if prev_close != 0 else 0
 
@@ -89,23 +341,59 @@ class NetworkConfigManager:
                 'interface': interface,
                 'name': stock_name,
                 'ticker': ticker,
-                'price': int(current_price),
-                'change': int(change),
+                'price': current_price,
+                'change': change,
                 'change_percent': round(change_percent, 2),
-                'high': int(latest_data['High']),
-                'low': int(latest_data['Low']),
-                'volume': int(latest_data['Volume']),
+                'high': high,
+                'low': low,
+                'volume': volume,
                 'status': 'UP' if change >= 0 else 'DOWN',
-                'date': df.index[-1].strftime('%Y-%m-%d')
+                'date': date_str
             }
 
         except Exception as e:
             print(f"[ERROR] Interface {interface} check failed: {str(e)}")
             return None
 
-    def show_interface_details(self, interface: str):
-        """인터페이스 상세 정보 표시"""
-        info = self.check_interface_status(interface)
+    def check_all_interfaces_concurrently(self):
+        """티커별 조회를 스레드 풀로 병렬 실행 (일괄 조회 폴백 경로)
+
+        네트워크 I/O 대기가 지배적이므로 min(N, workers)배 빨라진다.
+        풀 크기는 NETMON_WORKERS 환경변수로 조절 (기본 8, KRX 부하 고려).
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        try:
+            max_workers = int(os.environ.get('NETMON_WORKERS', '8'))
+        except ValueError:
+            max_workers = 8
+
+        # 조회 구간은 한 번만 계산해 공유 (자정 경계에 날짜가 갈리는 것도 방지)
+        now = datetime.now()
+        end_date = now.strftime('%Y%m%d')
+        start_date = (now - timedelta(days=5)).strftime('%Y%m%d')
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self.check_interface_status, iface, end_date, start_date): iface
+                       for iface in self.interfaces}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        # 삽입 순서대로 되돌려 표 출력 순서를 안정적으로 유지
+        return {iface: results.get(iface) for iface in self.interfaces}
+
+    def clear_cache(self):
+        """조회 캐시 초기화 (관심종목 변경/복원 후 호출)"""
+        _fetch_ohlcv_cached.cache_clear()
+
+    def show_interface_details(self, interface: str, info: dict = None):
+        """인터페이스 상세 정보 표시
+
+        호출부에 이미 조회된 info가 있으면 넘겨받아 재조회를 생략한다.
+        """
+        if info is None:
+            info = self.check_interface_status(interface)
 
         if not info:
             print(f"[ERROR] Interface {interface} not found or unavailable")
@@ -134,35 +422,42 @@ class NetworkConfigManager:
     def show_all_interfaces(self):
         """모든 인터페이스 상태 요약"""
         print("Network Interface Status Summary")
-        print("=" * 95)
-        print(f"{'Interface':<15} {'Throughput':<13} {'Change':<17} {'High':<10} {'Low':<10} {'Status':<8} {'Packets':<12}")
-        print("-" * 95)
+        print(_TABLE_SEP_EQ)
+        print(_TABLE_HEADER)
+        print(_TABLE_SEP_DASH)
 
-        for interface in self.interfaces.keys():
-            info = self.check_interface_status(interface)
+        try:
+            snapshots = self._fetch_all_snapshots()
+        except Exception as e:
+            print(f"[ERROR] Bulk status fetch failed: {str(e)}")
+            snapshots = None
+
+        fallback_infos = None if snapshots is not None else self.check_all_interfaces_concurrently()
+
+        for interface in self.interface_keys:
+            if snapshots is not None:
+                info = self._snapshot_status(interface, snapshots)
+            else:
+                info = fallback_infos[interface]
             if info:
                 status_icon = "🟢" if info['status'] == 'UP' else "🔴"
                 change_display = f"{info['change']:+,} ({info['change_percent']:+.2f}%)"
 
-                print(f"{interface:<15} {info['price']:>10,} Mbps {change_display:<17} {info['high']:>9,} {info['low']:>9,} {status_icon}{info['status']:<7} {info['volume']:>11,}")
+                print(_ROW_FMT.format(iface=interface, price=info['price'], change=change_display,
+                                      high=info['high'], low=info['low'], icon=status_icon,
+                                      status=info['status'], volume=info['volume']))
 
-        print("-" * 95)
+        print(_TABLE_SEP_DASH)
         print(f"Total Interfaces: {len(self.interfaces)} | Updated: {datetime.now().strftime('%H:%M:%S')}")
 
     def add_interface(self, ticker: str, name: str = None):
         """새로운 네트워크 인터페이스 추가 (실제로는 관심종목 추가)"""
-        # 인터페이스 이름 생성
-        interface_types = ['eth', 'wlan', 'br', 'lo', 'bond', 'vlan']
-        used_numbers = []
-
         # 기존 인터페이스에서 사용된 번호들 추출
-        for interface in self.interfaces.keys():
-            if interface.startswith(tuple(interface_types)):
-                try:
-                    num = int(''.join(filter(str.isdigit, interface.split('_')[0])))
-                    used_numbers.append(num)
-                except:
-                    pass
+        used_numbers = set()
+        for interface in self.interfaces:
+            m = _IFACE_NUM_RE.match(interface)
+            if m:
+                used_numbers.add(int(m.group(1)))
 
         # 사용 가능한 가장 작은 번호 찾기
         next_num = 0
@@ -170,14 +465,16 @@ class NetworkConfigManager:
             next_num += 1
 
         # 인터페이스 타입 순환
-        interface_type = interface_types[next_num % len(interface_types)]
+        interface_type = self.INTERFACE_TYPES[next_num % len(self.INTERFACE_TYPES)]
         interface_name = f"{interface_type}{next_num}_{ticker}"
 
         if name is None:
             name = f"종목_{ticker}"
 
         self.interfaces[interface_name] = name
-        self.save_interfaces()  # 자동 저장
+        self._keys_cache = None
+        self._dirty = True  # 메뉴 복귀 시 일괄 저장
+        self.clear_cache()
         print(f"[INFO] Network interface {interface_name} ({name}) added successfully")
         return interface_name
 
@@ -186,7 +483,9 @@ class NetworkConfigManager:
         if interface in self.interfaces:
             name = self.interfaces[interface]
             del self.interfaces[interface]
-            self.save_interfaces()  # 자동 저장
+            self._keys_cache = None
+            self._dirty = True  # 메뉴 복귀 시 일괄 저장
+            self.clear_cache()
             print(f"[INFO] Network interface {interface} ({name}) removed successfully")
             return True
         else:
@@ -201,9 +500,11 @@ class NetworkConfigManager:
         print("-" * 70)
 
         for interface, name in self.interfaces.items():
-            ticker = interface.split('_')[1] if '_' in interface else 'N/A'
-            interface_type = ''.join(filter(str.isalpha, interface.split('_')[0]))
-            print(f"{interface:<20} {name:<25} {ticker:<10} {interface_type.upper():<10}")
+            parts = interface.split('_', 1)
+            ticker = parts[1] if len(parts) > 1 else 'N/A'
+            m = _ALPHA_PREFIX.match(parts[0])
+            interface_type = m.group(0).upper() if m else ''
+            print(f"{interface:<20} {name:<25} {ticker:<10} {interface_type:<10}")
 
         print("-" * 70)
         print(f"Total configured interfaces: {len(self.interfaces)}")
@@ -211,29 +512,31 @@ class NetworkConfigManager:
     def search_stock_by_name(self, search_term: str):
         """종목명으로 검색"""
         try:
-            from pykrx.website.krx.market.wrap import get_market_ticker_and_name
             from pykrx.stock.stock_api import get_nearest_business_day_in_a_week
 
             today = get_nearest_business_day_in_a_week()
 
-            # KOSPI와 KOSDAQ 데이터 가져오기
-            kospi_series = get_market_ticker_and_name(today, market="KOSPI")
-            kosdaq_series = get_market_ticker_and_name(today, market="KOSDAQ")
-
-            # 검색 결과
-            results = []
+            needles = [term.strip().lower() for term in search_term.split(',') if term.strip()]
+            if not needles:
+                return []
 
-            # KOSPI 검색
-            for ticker, stock_name in kospi_series.items():
-                if search_term.lower() in stock_name.lower():
-                    results.append((ticker, stock_name, 'KOSPI'))
+            if len(needles) > 1:
+                # 쉼표로 구분된 복수 검색어는 한 번 컴파일한 교대 패턴으로 매칭
+                matches = re.compile('|'.join(map(re.escape, needles))).search
+            else:
+                needle = needles[0]
+                matches = lambda name_lower: needle in name_lower
 
-            # KOSDAQ 검색
-            for ticker, stock_name in kosdaq_series.items():
-                if search_term.lower() in stock_name.lower():
-                    results.append((ticker, stock_name, 'KOSDAQ'))
+            # KOSPI/KOSDAQ 검색 (영업일 단위 캐시라 첫 검색만 네트워크 비용)
+            results = []
+            for market in ('KOSPI', 'KOSDAQ'):
+                for ticker, stock_name, name_lower in _get_ticker_name_map(today, market):
+                    if matches(name_lower):
+                        results.append((ticker, stock_name, market))
+                        if len(results) == 20:  # 최대 20개에서 조기 종료
+                            return results
 
-            return results[:20]  # 최대 20개만 반환
+            return results
 
         except Exception as e:
             print(f"[ERROR] Stock search failed: {str(e)}")
@@ -274,6 +577,11 @@ def main():
 
     while True:
         try:
+            # 모아둔 변경 사항을 한 번의 파일 쓰기로 반영
+            if netmgr._dirty:
+                if netmgr.save_interfaces():
+                    netmgr._dirty = False
+
             show_netconfig_menu()
             choice = input("netconfig@server:~$ ").strip()
 
@@ -282,12 +590,12 @@ def main():
 
             elif choice == '2':
                 print("\nAvailable interfaces:")
-                for i, interface in enumerate(netmgr.interfaces.keys(), 1):
+                for i, interface in enumerate(netmgr.interface_keys, 1):
                     print(f"{i:2d}. {interface}")
 
                 try:
                     idx = int(input("Select interface number: ")) - 1
-                    interfaces = list(netmgr.interfaces.keys())
+                    interfaces = netmgr.interface_keys
                     if 0 <= idx < len(interfaces):
                         netmgr.show_interface_details(interfaces[idx])
                     else:
@@ -320,63 +628,66 @@ def main():
                 print("Press Ctrl+C to stop monitoring\n")
 
                 try:
-                    import time
-
-                    # 첫 번째 출력
-                    output_lines = []
-                    output_lines.append("Real-time Network Interface Status Monitoring")
-                    output_lines.append("=" * 95)
-                    output_lines.append(f"{'Interface':<15} {'Throughput':<13} {'Change':<17} {'High':<10} {'Low':<10} {'Status':<8} {'Packets':<12}")
-                    output_lines.append("-" * 95)
-
-                    for interface in netmgr.interfaces.keys():
-                        info = netmgr.check_interface_status(interface)
-                        if info:
-                            status_icon = "🟢" if info['status'] == 'UP' else "🔴"
-                            change_display = f"{info['change']:+,} ({info['change_percent']:+.2f}%)"
-
-                            line = f"{interface:<15} {info['price']:>10,} Mbps {change_display:<17} {info['high']:>9,} {info['low']:>9,} {status_icon}{info['status']:<7} {info['volume']:>11,}"
-                            output_lines.append(line)
-
-                    output_lines.append("-" * 95)
-                    output_lines.append(f"Total Interfaces: {len(netmgr.interfaces)} | Updated: {datetime.now().strftime('%H:%M:%S')} | [Press Ctrl+C to stop]")
-
-                    # 첫 번째 전체 표시
-                    print("\n".join(output_lines))
-                    table_lines = len(output_lines)
-
+                    # 대체 스크린 버퍼로 진입 - 전체 화면을 한 번의 write로 갱신
+                    sys.stdout.write("\033[?1049h\033[H")
+
+                    # 표 버퍼를 한 번만 할당하고 틱마다 행만 덮어쓴다
+                    interface_keys = netmgr.interface_keys
+                    n_rows = len(interface_keys)
+                    output_lines = [''] * (n_rows + 6)
+                    output_lines[0] = "Real-time Network Interface Status Monitoring"
+                    output_lines[1] = _TABLE_SEP_EQ
+                    output_lines[2] = _TABLE_HEADER
+                    output_lines[3] = _TABLE_SEP_DASH
+                    output_lines[n_rows + 4] = _TABLE_SEP_DASH
+
+                    next_tick = time.monotonic()
                     while True:
-                        time.sleep(30)  # 30초마다 업데이트
+                        # 단조 시계에 고정된 페이싱 - 조회가 느려도 30초 주기가 밀리지 않는다
+                        sleep_for = next_tick - time.monotonic()
+                        if sleep_for > 0:
+                            time.sleep(sleep_for)
+                        elif sleep_for < -30:
+                            # 심하게 밀렸으면 따라잡기 폭주 대신 주기를 다시 고정
+                            next_tick = time.monotonic()
+                        next_tick += 30
 
-                        # 커서를 표 시작 위치로 이동 (ANSI 이스케이프 시퀀스)
-                        print(f"\033[{table_lines}A", end="")
+                        try:
+                            snapshots = netmgr._fetch_all_snapshots()
+                        except Exception as e:
+                            snapshots = None
 
-                        # 새로운 데이터로 표 다시 구성
-                        output_lines = []
-                        output_lines.append("Real-time Network Interface Status Monitoring")
-                        output_lines.append("=" * 95)
-                        output_lines.append(f"{'Interface':<15} {'Throughput':<13} {'Change':<17} {'High':<10} {'Low':<10} {'Status':<8} {'Packets':<12}")
-                        output_lines.append("-" * 95)
+                        fallback_infos = None if snapshots is not None else netmgr.check_all_interfaces_concurrently()
 
-                        for interface in netmgr.interfaces.keys():
-                            info = netmgr.check_interface_status(interface)
+                        for i, interface in enumerate(interface_keys):
+                            if snapshots is not None:
+                                info = netmgr._snapshot_status(interface, snapshots)
+                            else:
+                                info = fallback_infos[interface]
                             if info:
                                 status_icon = "🟢" if info['status'] == 'UP' else "🔴"
                                 change_display = f"{info['change']:+,} ({info['change_percent']:+.2f}%)"
 
-                                line = f"{interface:<15} {info['price']:>10,} Mbps {change_display:<17} {info['high']:>9,} {info['low']:>9,} {status_icon}{info['status']:<7} {info['volume']:>11,}"
-                                output_lines.append(line)
+                                output_lines[4 + i] = _ROW_FMT.format(iface=interface, price=info['price'],
+                                                                      change=change_display, high=info['high'],
+                                                                      low=info['low'], icon=status_icon,
+                                                                      status=info['status'], volume=info['volume'])
+                            else:
+                                output_lines[4 + i] = f"{interface:<15} -- no data --"
 
-                        output_lines.append("-" * 95)
-                        output_lines.append(f"Total Interfaces: {len(netmgr.interfaces)} | Updated: {datetime.now().strftime('%H:%M:%S')} | [Press Ctrl+C to stop]")
+                        output_lines[n_rows + 5] = f"Total Interfaces: {n_rows} | Updated: {datetime.now().strftime('%H:%M:%S')} | [Press Ctrl+C to stop]"
 
-                        # 각 줄을 지우고 새로 출력
-                        for line in output_lines:
-                            print(f"\033[2K{line}")  # 현재 줄 지우고 새로 출력
+                        # 홈으로 커서 이동 후 화면 전체를 원자적으로 다시 그림
+                        sys.stdout.write("\033[H" + "\n".join(output_lines) + "\n")
+                        sys.stdout.flush()
 
                 except KeyboardInterrupt:
+                    sys.stdout.write("\033[?1049l")  # 원래 화면 복원
+                    sys.stdout.flush()
                     print("\nReal-time monitoring stopped")
                 except Exception as e:
+                    sys.stdout.write("\033[?1049l")  # 원래 화면 복원
+                    sys.stdout.flush()
                     print(f"Monitoring error: {str(e)}")
 
             elif choice == '7':
@@ -437,7 +748,7 @@ def main():
             elif choice == '10':
                 # 네트워크 인터페이스 제거 (종목 제거)
                 print("\nCurrent Network Interfaces:")
-                interfaces = list(netmgr.interfaces.keys())
+                interfaces = netmgr.interface_keys
                 if not interfaces:
                     print("No interfaces configured")
                 else:
@@ -479,6 +790,8 @@ def main():
                     }
 
                     netmgr.interfaces = default_config.copy()
+                    netmgr._keys_cache = None
+                    netmgr.clear_cache()
                     if netmgr.save_interfaces():
                         print("[SUCCESS] Network configuration reset to defaults")
                     else:
@@ -505,7 +818,12 @@ def main():
                         print(f"[ERROR] Backup failed: {str(e)}")
 
                 elif backup_choice == '2':
-                    backup_files = [f for f in os.listdir('.') if f.startswith('network_interfaces_backup_') and f.endswith('.json')]
+                    # 디렉터리를 스트리밍으로 거르고, 최신 백업이 1번에 오도록 정렬
+                    with os.scandir('.') as it:
+                        backup_entries = [e for e in it
+                                          if e.name.startswith('network_interfaces_backup_') and e.name.endswith('.json')]
+                    backup_entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+                    backup_files = [e.name for e in backup_entries]
                     if not backup_files:
                         print("No backup files found")
                     else:
@@ -519,6 +837,7 @@ def main():
                                 import shutil
                                 shutil.copy2(backup_files[idx], netmgr.config_file)
                                 netmgr.interfaces = netmgr.load_interfaces()
+                                netmgr.clear_cache()
                                 print(f"[SUCCESS] Configuration restored from: {backup_files[idx]}")
                             else:
                                 print("[ERROR] Invalid selection")